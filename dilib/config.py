@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable, TypeVar, cast
-
-from typing_extensions import override
+import functools
+import itertools
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Mapping,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from typing_extensions import TypeAlias, override
 
 import dilib.errors
 import dilib.specs
@@ -13,6 +26,25 @@ import dilib.utils
 T = TypeVar("T")
 TC = TypeVar("TC", bound="Config")
 
+# Categories of config class variables
+_NOT_SPEC = 0
+_GLOBAL_INPUT = 1
+_LOCAL_INPUT = 2
+_CONFIG_SPEC = 3
+_PLAIN_SPEC = 4
+
+# key -> (category, spec)
+_SpecClassification: TypeAlias = Dict[str, Tuple[int, Any]]
+
+# (config to load, local inputs) -> None
+_Resolver: TypeAlias = Callable[["Config", Mapping[str, Any]], None]
+
+_MISSING = object()
+
+# NB: Shared by configs without child configs or global inputs.
+# Must never be mutated.
+_EMPTY: dict[Any, Any] = {}
+
 
 class ConfigSpec(dilib.specs.Spec[TC]):
     """Represents nestable bag of types and values.
@@ -20,15 +52,27 @@ class ConfigSpec(dilib.specs.Spec[TC]):
     :meta private:
     """
 
-    _INTERNAL_FIELDS = dilib.specs.Spec._INTERNAL_FIELDS + [
+    __slots__ = (
+        "cls",
+        "local_inputs",
+        "_local_inputs_items",
+        "_hash",
+    )
+
+    _INTERNAL_FIELDS = dilib.specs.Spec._INTERNAL_FIELDS | {
         "cls",
         "local_inputs",
-    ]
+        "_local_inputs_items",
+        "_hash",
+    }
 
     def __init__(self, cls: type[TC], **local_inputs: Any) -> None:
         super().__init__()
         self.cls = cls
         self.local_inputs = local_inputs
+        # NB: Canonical form of local inputs for hashing and equality.
+        self._local_inputs_items = tuple(sorted(local_inputs.items()))
+        self._hash: int | None = None
 
     def get(self, **global_inputs: Any) -> Config:
         """Instantiate with given global inputs."""
@@ -37,32 +81,175 @@ class ConfigSpec(dilib.specs.Spec[TC]):
 
         # noinspection PyProtectedMember
         global_input_keys = config._get_all_global_input_keys()
-        extra_global_input_keys = set(global_inputs.keys()) - global_input_keys
+        extra_global_input_keys = [
+            key for key in global_inputs if key not in global_input_keys
+        ]
         if extra_global_input_keys:
             raise dilib.errors.InputConfigError(
                 f"Provided extra global inputs "
-                f"not specified in configs: {extra_global_input_keys}"
+                f"not specified in configs: {set(extra_global_input_keys)}"
             )
 
         return config
 
     @override
     def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
+
         return (
             type(other) is ConfigSpec
             and self.cls is other.cls
-            and self.local_inputs == other.local_inputs
+            and self._local_inputs_items == other._local_inputs_items
         )
 
     @override
     def __hash__(self) -> int:
-        return hash(
-            (
-                self.__class__.__name__,
-                frozenset(self.local_inputs.items()),
-            )
+        # NB: Used as `ConfigLocator` cache key, so compute only once.
+        if self._hash is None:
+            self._hash = hash((self.cls, self._local_inputs_items))
+        return self._hash
+
+
+def _classify_specs(cls: type[Config]) -> _SpecClassification:
+    """Categorize class variables of config class once per class."""
+    spec_classification: _SpecClassification = {}
+    # NB: Reading values straight from the class dict (instead of via
+    # `getattr(cls, key)`) is equivalent because specs aren't descriptors.
+    for key, spec in vars(cls).items():
+        if key in _INTERNAL_FIELDS_SET or key.startswith("__"):
+            continue
+
+        # Skip partial kwargs (no registration needed).
+        if isinstance(spec, dict):
+            continue
+
+        assert not (
+            isinstance(spec, dilib.specs.Spec)
+            and hasattr(type(spec), "__get__")
+        ), f"Spec must not be a descriptor: {key!r}"
+
+        # NB: Defer error to `Config._load` to raise at instantiation time.
+        # noinspection PyProtectedMember
+        if not isinstance(spec, dilib.specs.Spec):
+            category = _NOT_SPEC
+        elif isinstance(spec, dilib.specs._GlobalInput):
+            category = _GLOBAL_INPUT
+        elif isinstance(spec, dilib.specs._LocalInput):
+            category = _LOCAL_INPUT
+        elif isinstance(spec, ConfigSpec):
+            category = _CONFIG_SPEC
+        else:
+            category = _PLAIN_SPEC
+
+        spec_classification[key] = (category, spec)
+
+    return spec_classification
+
+
+def _build_resolver(cls: type[Config]) -> _Resolver:
+    """Precompile how to load instances of config class.
+
+    Only input values and child config instances can differ between
+    instances, so everything else is computed once here.
+    """
+    # NB: These are shared by all instances, so must never be mutated
+    # (which is fine because keys can't change once a config is loaded).
+    # spec id -> spec key
+    keys: dict[dilib.specs.SpecID, str] = {}
+    # global input key -> spec id
+    global_inputs: dict[str, dilib.specs.SpecID] = {}
+
+    # NB: Inputs are included (and replaced per instance) to keep
+    # class variable order.
+    # key -> spec
+    specs: dict[str, dilib.specs.Spec[Any]] = {}
+
+    global_input_specs: list[tuple[str, Any]] = []
+    local_input_specs: list[tuple[str, Any]] = []
+    child_config_specs: list[tuple[str, ConfigSpec[Any]]] = []
+
+    for key, (category, spec) in cls._spec_classification.items():
+        if category == _NOT_SPEC:
+            return functools.partial(_raise_not_spec_error, key, spec)
+
+        keys[spec.spec_id] = key
+
+        if category == _GLOBAL_INPUT:
+            global_inputs[key] = spec.spec_id
+            global_input_specs.append((key, spec))
+            specs[key] = spec
+        elif category == _LOCAL_INPUT:
+            local_input_specs.append((key, spec))
+            specs[key] = spec
+        elif category == _CONFIG_SPEC:
+            child_config_specs.append((key, spec))
+        else:
+            specs[key] = spec
+
+    # NB: Leaf configs (i.e., most of them) don't need their own
+    # dicts for child configs and global inputs.
+    return functools.partial(
+        _resolve,
+        keys,
+        specs,
+        global_inputs or _EMPTY,
+        tuple(global_input_specs),
+        tuple(local_input_specs),
+        tuple(child_config_specs),
+    )
+
+
+def _raise_not_spec_error(
+    key: str, value: Any, config: Config, local_inputs: Mapping[str, Any]
+) -> None:
+    raise ValueError(f"Expected Spec type, got {type(value)} with {key!r}")
+
+
+# noinspection PyProtectedMember
+def _resolve(
+    keys: dict[dilib.specs.SpecID, str],
+    specs: dict[str, dilib.specs.Spec[Any]],
+    global_inputs: dict[str, dilib.specs.SpecID],
+    global_input_specs: tuple[tuple[str, Any], ...],
+    local_input_specs: tuple[tuple[str, Any], ...],
+    child_config_specs: tuple[tuple[str, ConfigSpec[Any]], ...],
+    config: Config,
+    local_inputs: Mapping[str, Any],
+) -> None:
+    """Load config per parts precompiled by `_build_resolver()`."""
+    config_locator = config._config_locator
+
+    config_specs = specs.copy()
+    for key, spec in global_input_specs:
+        config_specs[key] = config._process_input(
+            key, spec, config_locator.global_inputs, "Global"
+        )
+    for key, spec in local_input_specs:
+        config_specs[key] = config._process_input(
+            key, spec, local_inputs, "Local"
         )
 
+    config._keys = keys
+    config._specs = config_specs
+    config._global_inputs = global_inputs
+    config._child_configs = {
+        key: config_locator.get(spec) for key, spec in child_config_specs
+    } or _EMPTY
+
+
+def _compile_specs(cls: type[Config]) -> None:
+    """(Re)build tables used to load instances of config class."""
+    cls._spec_classification = _classify_specs(cls)
+    cls._resolver = _build_resolver(cls)
+
+    # NB: Snapshot class dict to detect changes to class variables after
+    # class definition. Snapshot contains itself so that it compares
+    # equal to the class dict it's stored in.
+    class_vars = dict(vars(cls))
+    class_vars["_class_vars"] = class_vars
+    cls._class_vars = class_vars
+
 
 class Config:
     """Description of specs and how they depend on each other.
@@ -77,7 +264,9 @@ class Config:
     ...     y = dilib.Singleton(lambda x: x + 1)
     """
 
-    _INTERNAL_FIELDS = [
+    # NB: Subclasses (i.e., user configs) only describe specs as class
+    # variables, so they can set `__slots__ = ()` to drop `__dict__`.
+    __slots__ = (
         "_config_locator",
         "_keys",
         "_specs",
@@ -85,13 +274,41 @@ class Config:
         "_global_inputs",
         "_loaded",
         "_frozen",
-        "_get_all_global_input_keys",
-        "_process_input",
-        "_load",
-        "freeze",
-        "_get_spec",
-        "_get_child_class",
-    ]
+        "_dir_cache",
+        "__weakref__",
+    )
+
+    _INTERNAL_FIELDS = frozenset(
+        [
+            "_INTERNAL_FIELDS",
+            "_config_locator",
+            "_keys",
+            "_specs",
+            "_child_configs",
+            "_global_inputs",
+            "_loaded",
+            "_frozen",
+            "_dir_cache",
+            "_get_all_global_input_keys",
+            "_process_input",
+            "_load",
+            "_spec_classification",
+            "_resolver",
+            "_class_vars",
+            "freeze",
+            "_get_spec",
+            "_get_child_config",
+        ]
+    )
+
+    _spec_classification: _SpecClassification = {}
+    _resolver: ClassVar[_Resolver]
+    _class_vars: ClassVar[dict[str, Any]]
+
+    @override
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _compile_specs(cls)
 
     def __new__(
         cls: type[TC], *args: Any, _materialize: bool = False, **kwargs: Any
@@ -113,54 +330,65 @@ class Config:
             raise ValueError("Use config.get() to get instance of config")
         self._config_locator = config_locator
 
+        # NB: Set by `_load()`.
         # spec id -> spec key
-        self._keys: dict[dilib.specs.SpecID, str] = {}
+        self._keys: dict[dilib.specs.SpecID, str]
         # key -> spec
-        self._specs: dict[str, dilib.specs.Spec[Any]] = {}
+        self._specs: dict[str, dilib.specs.Spec[Any]]
         # child config key -> child config
-        self._child_configs: dict[str, Config] = {}
+        self._child_configs: dict[str, Config]
         # global input key -> spec id
-        self._global_inputs: dict[str, dilib.specs.SpecID] = {}
+        self._global_inputs: dict[str, dilib.specs.SpecID]
 
         self._loaded = False
         self._frozen = False
 
+        self._dir_cache: tuple[str, ...] | None = None
+
         self._load(**local_inputs)
 
     # For mypy
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return None
 
-    def _get_all_global_input_keys(
-        self,
-        all_global_input_keys: dict[str, dilib.specs.SpecID] | None = None,
-    ) -> set[str]:
-        """Recursively get all global input keys of self and its children."""
-        all_global_input_keys = (
-            all_global_input_keys if all_global_input_keys is not None else {}
-        )
+    def _get_all_global_input_keys(self) -> AbstractSet[str]:
+        """Get all global input keys of self and its children."""
+        all_global_input_keys: dict[str, dilib.specs.SpecID] = {}
+
+        # NB: Walk config tree iteratively (and visit shared child
+        # configs only once) instead of recursing per child.
+        stack: list[Config] = [self]
+        seen: set[int] = set()
+        while stack:
+            config = stack.pop()
+            if id(config) in seen:
+                continue
+            seen.add(id(config))
 
-        for key, spec_id in self._global_inputs.items():
-            if key in all_global_input_keys:
-                if all_global_input_keys[key] != spec_id:
+            # noinspection PyProtectedMember
+            for key, spec_id in config._global_inputs.items():
+                existing_spec_id = all_global_input_keys.get(key)
+                if (
+                    existing_spec_id is not None
+                    and existing_spec_id != spec_id
+                ):
                     raise dilib.errors.InputConfigError(
                         f"Found global input collision: {key!r}"
                     )
 
-            all_global_input_keys[key] = spec_id
+                all_global_input_keys[key] = spec_id
 
-        for _, child_config in self._child_configs.items():
             # noinspection PyProtectedMember
-            child_config._get_all_global_input_keys(all_global_input_keys)
+            stack.extend(config._child_configs.values())
 
-        return set(all_global_input_keys.keys())
+        return all_global_input_keys.keys()
 
     # noinspection PyProtectedMember
     def _process_input(
         self,
         key: str,
         spec: dilib.specs._Input[Any],
-        inputs: dict[str, Any],
+        inputs: Mapping[str, Any],
         desc: str,
     ) -> dilib.specs._Object[Any]:
         """Convert Input spec to Object spec."""
@@ -174,54 +402,22 @@ class Config:
                     f"{desc} input not set: {key!r}"
                 ) from None
 
-        dilib.utils.check_type(value, spec.type_, desc=desc)
+        # NB: Skip call altogether when there's nothing to check.
+        type_ = spec.type_
+        if type_ is not None and type_ is not Any:
+            dilib.utils.check_type(value, type_, desc=desc)
 
         # Preserve old spec id.
         return dilib.specs._Object(value, spec_id=spec.spec_id)
 
     def _load(self, **local_inputs: Any) -> None:
         """Transfer class variables to instance."""
-        for key in self.__class__.__dict__:
-            if (
-                key.startswith("__")
-                or key == "_INTERNAL_FIELDS"
-                or key in self._INTERNAL_FIELDS
-            ):
-                continue
-
-            spec = getattr(self.__class__, key)
-
-            # Skip partial kwargs (no registration needed).
-            if isinstance(spec, dict):
-                continue
-
-            if not isinstance(spec, dilib.specs.Spec):
-                raise ValueError(
-                    f"Expected Spec type, got {type(spec)} with {key!r}"
-                )
-
-            # Register key.
-            self._keys[spec.spec_id] = key
-
-            # Handle inputs.
-            # noinspection PyProtectedMember
-            if isinstance(spec, dilib.specs._GlobalInput):
-                self._global_inputs[key] = spec.spec_id
-
-                spec = self._process_input(
-                    key, spec, self._config_locator.global_inputs, "Global"
-                )
-            # noinspection PyProtectedMember.
-            elif isinstance(spec, dilib.specs._LocalInput):
-                spec = self._process_input(key, spec, local_inputs, "Local")
-
-            # Handle child configs
-            if isinstance(spec, ConfigSpec):
-                child_config = self._config_locator.get(spec)
-                self._child_configs[key] = child_config
-            else:
-                self._specs[key] = spec
-
+        cls = type(self)
+        # NB: Class variables can be changed after class definition
+        # (e.g., `monkeypatch.setattr(FooConfig, "x", ...)`).
+        if vars(cls) != cls._class_vars:
+            _compile_specs(cls)
+        cls._resolver(self, local_inputs)
         self._loaded = True
 
     def freeze(self) -> None:
@@ -246,45 +442,61 @@ class Config:
     # prevent initial, class-level values from being used.
     @override
     def __getattribute__(self, key: str) -> Any:
-        if (
-            key.startswith("__")
-            or key == "_INTERNAL_FIELDS"
-            or key in self._INTERNAL_FIELDS
-        ):
-            return super().__getattribute__(key)
+        # NB: Use `object.__getattribute__` directly to avoid recursing
+        # through this method to get internal fields.
+        get = object.__getattribute__
+        if key in _INTERNAL_FIELDS_SET or key.startswith("__"):
+            return get(self, key)
 
-        try:
-            if key in self._child_configs:
-                return self._child_configs[key]
-            else:
-                return self._specs[key]
-        except KeyError:
-            raise KeyError(f"{self.__class__}: {key!r}") from None
+        # NB: Spec and child config keys are disjoint, so check specs
+        # (the more common case) first, with a single lookup each.
+        value = get(self, "_specs").get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = get(self, "_child_configs").get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        raise KeyError(f"{type(self)}: {key!r}")
 
     def __getitem__(self, key: str) -> Any:
-        return dilib.utils.nested_getattr(self, key)
+        # NB: Look up first address part directly in the internal dicts
+        # to avoid a round-trip through `__getattribute__`.
+        head, sep, tail = key.partition(".")
+
+        child_config = object.__getattribute__(self, "_child_configs").get(
+            head, _MISSING
+        )
+        if child_config is not _MISSING:
+            return child_config[tail] if sep else child_config
+
+        value = object.__getattribute__(self, "_specs").get(head, _MISSING)
+        if value is _MISSING:
+            value = getattr(self, head)
+        return dilib.utils.nested_getattr(value, tail) if sep else value
 
     def __contains__(self, key: str) -> Any:
         if "." in key:
             return dilib.utils.nested_contains(self, key)
         else:
-            return key in dir(self)
+            return key in self._specs or key in self._child_configs
 
     @override
     def __setattr__(self, key: str, value: Any) -> None:
-        if (
-            key.startswith("__")
-            or key == "_INTERNAL_FIELDS"
-            or key in self._INTERNAL_FIELDS
-        ):
-            return super().__setattr__(key, value)
+        if key in _INTERNAL_FIELDS_SET or key.startswith("__"):
+            return object.__setattr__(self, key, value)
 
         if self._frozen:
             raise dilib.errors.FrozenConfigError(
                 f"Cannot perturb frozen config: key={key!r}"
             )
 
-        if key not in self._specs and self._loaded:
+        # NB: `_load` writes to the internal dicts directly, so we only
+        # get here for perturbations of already-loaded keys.
+        specs = self._specs
+        old_spec = specs.get(key)
+        if old_spec is None:
             if key in self._child_configs:
                 raise dilib.errors.SetChildConfigError(
                     f"Cannot set child config: key={key!r}"
@@ -294,25 +506,41 @@ class Config:
                     f"Cannot add new keys to a loaded config: key={key!r}"
                 )
 
-        old_spec = self._specs[key]
-
         # Automatically wrap input if user hasn't done so.
         if not isinstance(value, dilib.specs.Spec):
             value = dilib.specs.Object(value)
 
-        self._specs[key] = value
+        specs[key] = value
 
         # Transfer old spec id.
-        value.spec_id = old_spec.spec_id
+        if value.spec_id != old_spec.spec_id:
+            value.spec_id = old_spec.spec_id
 
     def __setitem__(self, key: str, value: Any) -> None:
-        dilib.utils.nested_setattr(self, key, value)
+        if "." in key:
+            dilib.utils.nested_setattr(self, key, value)
+        else:
+            setattr(self, key, value)
 
     @override
     def __dir__(self) -> Iterable[str]:
-        return sorted(
-            list(self._specs.keys()) + list(self._child_configs.keys())
-        )
+        # NB: Keys cannot be added or removed once loaded,
+        # so no need to invalidate. Cache as tuple so callers
+        # can't mutate it.
+        if self._dir_cache is None:
+            self._dir_cache = tuple(
+                sorted(itertools.chain(self._specs, self._child_configs))
+            )
+        return self._dir_cache
+
+
+# NB: Bind at module level so that `Config.__getattribute__` doesn't
+# need any attr lookups to check for internal fields. This is the only
+# source of truth for internal fields of configs (i.e., subclasses
+# can't extend `_INTERNAL_FIELDS`).
+_INTERNAL_FIELDS_SET = Config._INTERNAL_FIELDS
+
+_compile_specs(Config)
 
 
 class ConfigLocator:
@@ -325,9 +553,19 @@ class ConfigLocator:
         self.global_inputs: dict[str, Any] = global_inputs
 
         self._config_cache: dict[ConfigSpec[Any], Config] = {}
+        # NB: Config specs are kept alive as keys of `_config_cache`,
+        # so their ids can't be reused while the locator is alive.
+        # config spec id -> config
+        self._identity_cache: dict[int, Config] = {}
 
     def get(self, config_spec: ConfigSpec[Any]) -> Config:
         """Get Config instance by type."""
+        # Fast path for same config spec (e.g., class variable of parent).
+        try:
+            return self._identity_cache[id(config_spec)]
+        except KeyError:
+            pass
+
         try:
             return self._config_cache[config_spec]
         except KeyError:
@@ -340,6 +578,7 @@ class ConfigLocator:
             **config_spec.local_inputs,
         )
         self._config_cache[config_spec] = config
+        self._identity_cache[id(config_spec)] = config
         return cast(Config, config)
 
 
@@ -68,7 +68,9 @@ class Spec(Generic[T]):
     Use one of child classes when describing objects.
     """
 
-    _INTERNAL_FIELDS = ["spec_id"]
+    __slots__ = ("spec_id",)
+
+    _INTERNAL_FIELDS = frozenset(["spec_id"])
     NEXT_SPEC_ID = 0
 
     def __init__(self, spec_id: SpecID | None = None) -> None:
@@ -79,11 +81,7 @@ class Spec(Generic[T]):
 
     @override
     def __setattr__(self, name: str, value: Any) -> None:
-        if (
-            name.startswith("__")
-            or name == "_INTERNAL_FIELDS"
-            or name in self._INTERNAL_FIELDS
-        ):
+        if name in type(self)._INTERNAL_FIELDS or name.startswith("__"):
             return super().__setattr__(name, value)
 
         # NB: We considered supporting this kind of perturbation,
@@ -112,7 +110,7 @@ class Spec(Generic[T]):
 class _Object(Spec[T]):
     """Represents fully-instantiated object to pass through."""
 
-    _INTERNAL_FIELDS = Spec._INTERNAL_FIELDS + ["obj"]
+    _INTERNAL_FIELDS = Spec._INTERNAL_FIELDS | {"obj"}
 
     def __init__(self, obj: T, spec_id: SpecID | None = None) -> None:
         super().__init__(spec_id=spec_id)
@@ -136,7 +134,7 @@ def Object(obj: T) -> T:  # noqa: N802
 class _Input(Spec[T]):
     """Represents user input to config."""
 
-    _INTERNAL_FIELDS = Spec._INTERNAL_FIELDS + ["type_", "default"]
+    _INTERNAL_FIELDS = Spec._INTERNAL_FIELDS | {"type_", "default"}
 
     def __init__(
         self, type_: type[T] | None = None, default: Any = MISSING
@@ -209,12 +207,12 @@ def LocalInput(  # noqa: N802
 class _Callable(Spec[T]):
     """Represents callable (e.g., func, type) to be called with given args."""
 
-    _INTERNAL_FIELDS = Spec._INTERNAL_FIELDS + [
+    _INTERNAL_FIELDS = Spec._INTERNAL_FIELDS | {
         "func_or_type",
         "args",
         "lazy_kwargs",
         "kwargs",
-    ]
+    }
 
     def __init__(
         self,
@@ -1,7 +1,9 @@
 # mypy: disable-error-code="comparison-overlap"
 from __future__ import annotations
 
+import abc
 import dataclasses
+import pickle
 import types
 from typing import Any, TypeVar, cast
 
@@ -57,6 +59,7 @@ with dilib.config_context():
 
 def test_config_spec() -> None:
     # No inputs
+    assert BasicConfig() is not BasicConfig()
     assert BasicConfig() == BasicConfig()
     assert hash(BasicConfig()) == hash(BasicConfig())
 
@@ -67,6 +70,14 @@ def test_config_spec() -> None:
     assert hash(BasicConfig(x=1, y="hi")) == hash(BasicConfig(x=1, y="hi"))
     assert hash(BasicConfig(x=1, y="hi")) != hash(BasicConfig())
 
+    # Picklable
+    pickle.dumps(BasicConfig(x=1, y="hi"))
+
+    # Unhashable inputs
+    assert BasicConfig(x=[1]) is not BasicConfig(x=[1])
+    assert BasicConfig(x=[1]) == BasicConfig(x=[1])
+    assert BasicConfig(x=[1]) != BasicConfig(x=[2])
+
 
 @pytest.mark.parametrize("more_type_safe", [True, False])
 def test_basic(more_type_safe: bool) -> None:
@@ -105,6 +116,30 @@ def test_perturb_after_freeze(more_type_safe: bool) -> None:
         config.x = 100
 
 
+def test_perturb_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Replace class-level spec
+    monkeypatch.setattr(BasicConfig, "x", dilib.Object(2))
+    assert dilib.get_config(BasicConfig)._get_spec("x").obj == 2
+
+    # Add class-level spec
+    monkeypatch.setattr(BasicConfig, "new_x", dilib.Object(3), raising=False)
+    assert dilib.get_config(BasicConfig)._get_spec("new_x").obj == 3
+
+    # Undo (including deleting added spec)
+    monkeypatch.undo()
+    config = dilib.get_config(BasicConfig)
+    assert config._get_spec("x").obj == 1
+    assert "new_x" not in config
+
+
+def test_mix_in_abc() -> None:
+    # Config has no custom metaclass, so no metaclass conflict
+    class ABCConfig(dilib.Config, abc.ABC):
+        pass
+
+    assert isinstance(ABCConfig(), dilib.specs.Spec)
+
+
 @pytest.mark.parametrize("more_type_safe", [True, False])
 def test_add_key_after_load(more_type_safe: bool) -> None:
     config = get_config(BasicConfig, more_type_safe=more_type_safe)
@@ -154,6 +189,11 @@ def test_dir(more_type_safe: bool) -> None:
     ]
     assert dir(config.parent_config0) == ["basic_config", "baz0"]
 
+    # Cached result can't be mutated by callers.
+    assert tuple(config.__dir__()) == tuple(dir(config))
+    with pytest.raises(AttributeError):
+        config.__dir__().append("zzz")  # type: ignore[attr-defined]
+
 
 @pytest.mark.parametrize("more_type_safe", [True, False])
 def test_nested_config(more_type_safe: bool) -> None:
@@ -162,11 +202,45 @@ def test_nested_config(more_type_safe: bool) -> None:
     assert id(config.parent_config0.basic_config) == id(
         config.parent_config1.basic_config
     )
+    assert config._get_child_config("parent_config0") is config.parent_config0
 
     assert_type(config.parent_config0.basic_config, BasicConfig)
     assert_type(config.parent_config0.basic_config.bar, PrototypeValueWrapper)
 
 
+class DuplicateChildConfig(dilib.Config):
+    basic_config0 = BasicConfig()
+    basic_config1 = BasicConfig()
+    values = dilib.Singleton(
+        ValuesWrapper, basic_config0, basic_config1, z=None
+    )
+
+
+class PerturbedWithChildConfig(dilib.Config):
+    x: Any = dilib.Object(1)
+
+
+@pytest.mark.parametrize("more_type_safe", [True, False])
+def test_perturb_with_config_spec(more_type_safe: bool) -> None:
+    # Perturbing another config with a config spec must not affect
+    # any config declaring an equal child config.
+    perturbed_config = get_config(
+        PerturbedWithChildConfig, more_type_safe=more_type_safe
+    )
+    perturbed_config.x = BasicConfig()
+
+    config = get_config(DuplicateChildConfig, more_type_safe=more_type_safe)
+    assert sorted(config._keys.values()) == [
+        "basic_config0",
+        "basic_config1",
+        "values",
+    ]
+
+    container = dilib.get_container(config)
+    assert container.values.x.x == 1
+    assert container.values.y.x == 1
+
+
 @pytest.mark.parametrize("more_type_safe", [True, False])
 def test_perturb_nested_config_attrs(more_type_safe: bool) -> None:
     config = get_config(GrandParentConfig, more_type_safe=more_type_safe)
@@ -193,6 +267,25 @@ def test_perturb_nested_config_strs(more_type_safe: bool) -> None:
     assert config["parent_config1.some_str1"].obj == "def"
 
 
+@pytest.mark.parametrize("more_type_safe", [True, False])
+def test_getitem(more_type_safe: bool) -> None:
+    config = get_config(GrandParentConfig, more_type_safe=more_type_safe)
+
+    assert config["some_str0"] is config.some_str0
+    assert config["parent_config0"] is config.parent_config0
+    assert (
+        config["parent_config0.basic_config"]
+        is config.parent_config0.basic_config
+    )
+    assert config["parent_config0.basic_config.x.obj"] == 1
+
+    with pytest.raises(KeyError):
+        config["missing"]
+
+    with pytest.raises(KeyError):
+        config["parent_config0.missing"]
+
+
 @pytest.mark.parametrize("more_type_safe", [True, False])
 def test_perturb_nested_child_config(more_type_safe: bool) -> None:
     config = get_config(GrandParentConfig, more_type_safe=more_type_safe)
@@ -236,6 +329,53 @@ def test_input_config(more_type_safe: bool) -> None:
     assert config.input_config0._get_spec("context").obj == "default"
     assert config.input_config0._get_spec("x").obj == 1
 
+    expected_global_input_keys = {"name", "context"}
+    assert config._get_all_global_input_keys() == expected_global_input_keys
+
+
+class AnyInputConfig(dilib.Config):
+    x = dilib.GlobalInput(Any)
+    y: Any = dilib.LocalInput()
+
+
+class AnyInputParentConfig(dilib.Config):
+    any_input_config = AnyInputConfig(y=(1,))
+
+
+def test_any_input_config() -> None:
+    config = dilib.get_config(AnyInputParentConfig, x="hi")
+
+    assert config.any_input_config._get_spec("x").obj == "hi"
+    assert config.any_input_config._get_spec("y").obj == (1,)
+
+
+class LocalInputTypeConfig(dilib.Config):
+    x: Any = dilib.LocalInput()
+
+
+class LocalInputBoolConfig(dilib.Config):
+    local_input_type_config = LocalInputTypeConfig(x=True)
+
+
+class LocalInputIntConfig(dilib.Config):
+    local_input_type_config = LocalInputTypeConfig(x=1)
+
+
+class LocalInputFloatConfig(dilib.Config):
+    local_input_type_config = LocalInputTypeConfig(x=1.0)
+
+
+def test_equal_local_inputs_of_different_types() -> None:
+    # NB: `True == 1 == 1.0`, but each config should get its own value.
+    for config_cls, expected_type in [
+        (LocalInputBoolConfig, bool),
+        (LocalInputIntConfig, int),
+        (LocalInputFloatConfig, float),
+    ]:
+        config = dilib.get_config(config_cls)
+        value = config.local_input_type_config._get_spec("x").obj
+        assert type(value) is expected_type
+
 
 class CollectionConfig(dilib.Config):
     x = dilib.Object(1)
@@ -314,6 +454,31 @@ def test_extra_global_inputs() -> None:
             raise
 
 
+class NonSpecConfig(dilib.Config):
+    x = dilib.Object(1)
+    y = 2
+
+
+class ExtendedInternalFieldsConfig(dilib.Config):
+    _INTERNAL_FIELDS = dilib.Config._INTERNAL_FIELDS | {"x"}
+
+    x = dilib.Object(1)
+
+
+def test_extended_internal_fields() -> None:
+    # Subclass overrides of internal fields are ignored
+    config = dilib.get_config(ExtendedInternalFieldsConfig)
+    assert config._get_spec("x").obj == 1
+
+    config.x = 2
+    assert config._get_spec("x").obj == 2
+
+
+def test_non_spec() -> None:
+    with pytest.raises(ValueError, match="Expected Spec type"):
+        dilib.get_config(NonSpecConfig)
+
+
 class InputConfigWithCollision(dilib.Config):
     input_config0 = InputConfig0(x=1)
 
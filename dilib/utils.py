@@ -100,10 +100,11 @@ def nested_setattr(obj: Any, address: str, value: Any) -> None:
     >>> nested_setattr(a, "b.c", 123)
     >>> a.b.c
     123
+    >>> nested_setattr(a, "d", 456)
+    >>> a.d
+    456
     """
-    split_address = address.split(".")
-    for idx, address_part in enumerate(split_address):
-        if idx < len(split_address) - 1:
-            obj = getattr(obj, address_part)
-        else:
-            setattr(obj, address_part, value)
+    parent_address, _, last_address_part = address.rpartition(".")
+    if parent_address:
+        obj = nested_getattr(obj, parent_address)
+    setattr(obj, last_address_part, value)